@@ -1,26 +1,36 @@
 import datetime
+import functools
 import math
 import time
-import json
 import logging
 import shutil
 import argparse
+import hashlib
+import os
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union, Optional, Tuple, Iterable, Iterator, Set, Callable
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from jsonschema import validate, ValidationError
+import fastjsonschema  # type: ignore[import-untyped]
+import orjson
+from fastjsonschema import JsonSchemaException
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+from markupsafe import Markup
 
 # -----------------------------
 # Configuration
 # -----------------------------
-CONFIG = {
+CONFIG: Dict[str, Any] = {
     "PAGES_FILE": Path("data/pages.json"),
     "ROCKETS_FILE": Path("data/rockets.json"),
     "ROCKETS_SCHEMA_FILE": Path("models/rockets.schema.json"),
     "OUTPUT_DIR": Path("output_site"),
+    "MANIFEST_FILE": Path(".build_manifest.json"), # Page digests of the last build, local build state
     "TEMPLATE_DIR": Path("templates"),
     "ASSETS_DIR": Path("assets"),
+    "JINJA_CACHE_DIR": Path(".jinja_cache"),
+    "TEMPLATES": ("index.html", "about.html", "rockets.html", "rocket.html", "variant.html", "_nav.html", "_footer.html"),
     "ITEMS_PER_PAGE": 30,
     "INDEX_TITLE": "Home",
     "ROCKET_LIST_TITLE": "Rockets",
@@ -30,225 +40,407 @@ CONFIG = {
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s", datefmt="%H:%M:%S")
 logger = logging.getLogger(__name__)
 
+# Jinja2 environment and loaded templates, created once per process (see `get_env`)
+_env: Optional[Environment] = None
+_templates: Dict[str, Template] = {}
+
+# Context and previous build manifest shared by every task of a render worker (set up by `init_worker`)
+_worker_base_context: Dict[str, Any] = {}
+_worker_manifest: Dict[str, str] = {}
+
 # -----------------------------
 # Utility Functions
 # -----------------------------
 def load_json(file_path: Path) -> Any:
     """Loads a JSON file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return orjson.loads(file_path.read_bytes())
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         return []
 
-def cleanup_and_setup(output_path: Path, assets_path: Path):
-    """Safely removes and recreates the output directory, then copies assets."""
-    if output_path.exists():
-        shutil.rmtree(output_path)
+def create_environment() -> Environment:
+    """Creates the secure Jinja2 environment used to render every page.
+
+    Compiled templates are persisted in JINJA_CACHE_DIR so later builds skip parsing."""
+    CONFIG["JINJA_CACHE_DIR"].mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(str(CONFIG["TEMPLATE_DIR"])),
+        autoescape=select_autoescape(['html', 'xml']),
+        trim_blocks=True, 
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1, # Only a handful of templates: never evict a compiled one
+        bytecode_cache=FileSystemBytecodeCache(
+            directory=str(CONFIG["JINJA_CACHE_DIR"]),
+            pattern="__jinja2_%s.cache"
+        )
+    )
+
+def init_worker(base_context: Dict[str, Any], manifest: Dict[str, str]) -> None:
+    """Stores the context and previous manifest shared by every task of a render worker process."""
+    global _worker_base_context, _worker_manifest
+    _worker_base_context = base_context
+    _worker_manifest = manifest
+
+def get_env() -> Environment:
+    """Returns the process-wide Jinja2 environment, creating it on first use.
+
+    Reusing it keeps Jinja's in-memory template cache alive across builds in the same process."""
+    global _env
+    if _env is None:
+        _env = create_environment()
+    return _env
+
+def get_template(template_name: str) -> Template:
+    """Returns a template of the process-wide environment, loading it only once."""
+    if (template := _templates.get(template_name)) is None:
+        template = _templates[template_name] = get_env().get_template(template_name)
+    return template
+
+def preload_templates() -> None:
+    """Loads every page template up front so render workers inherit them ready to use."""
+    for template_name in CONFIG["TEMPLATES"]:
+        get_template(template_name)
+
+def get_executor(base_context: Dict[str, Any], manifest: Dict[str, str]) -> ProcessPoolExecutor:
+    """Creates a process pool whose workers share the global page context and previous manifest."""
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=init_worker,
+        initargs=(base_context, manifest)
+    )
+
+def create_validator(schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Compiles a JSON schema once into a Python validation function.
+
+    Schema defaults are not injected, so the data is validated without being modified."""
+    validator: Callable[[Any], Any] = fastjsonschema.compile(schema, use_default=False)
+    return validator
+
+def cleanup_and_setup(output_path: Path, assets_path: Path, clean: bool) -> List[str]:
+    """Prepares the output directory, removing it first for a clean build, then syncs assets.
+
+    Returns the '/'-separated paths of the assets, relative to the output directory."""
+    if clean:
+        shutil.rmtree(output_path, ignore_errors=True)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    if assets_path.exists():
-        shutil.copytree(assets_path, output_path / "assets", dirs_exist_ok=True)
-    logger.info("Output directory cleaned and assets copied.")
+    asset_paths = copy_assets(assets_path, output_path / "assets") if assets_path.exists() else []
+    logger.info(f"Output directory {'cleaned' if clean else 'kept'} and assets synced.")
+    return [f"assets/{path}".replace(os.sep, "/") for path in asset_paths]
+
+def copy_assets(src_dir: Path, dest_dir: Path, rel_dir: str = "") -> List[str]:
+    """Copies the assets that are new or changed since the last build.
 
-def compute_base_url(output_path: Path) -> str:
-    """Calculates the relative path (e.g., '../', '../../') to the root index."""
+    Uses os.scandir so each source file is stat'ed once, and shutil.copy2 which copies in-kernel
+    (os.sendfile) where available. Returns the paths of every asset, relative to `src_dir`."""
+    asset_paths = []
+    os.makedirs(os.path.join(dest_dir, rel_dir), exist_ok=True)
+    with os.scandir(os.path.join(src_dir, rel_dir)) as entries:
+        for entry in entries:
+            rel_path = os.path.join(rel_dir, entry.name)
+            if entry.is_dir():
+                asset_paths.extend(copy_assets(src_dir, dest_dir, rel_path))
+                continue
+            dest = os.path.join(dest_dir, rel_path)
+            src_stat = entry.stat()
+            try:
+                dest_stat = os.stat(dest)
+                unchanged = (dest_stat.st_size, dest_stat.st_mtime_ns) == (src_stat.st_size, src_stat.st_mtime_ns)
+            except FileNotFoundError:
+                unchanged = False
+            if not unchanged:
+                shutil.copy2(entry.path, dest)
+            asset_paths.append(rel_path)
+    return asset_paths
+
+def load_manifest(manifest_path: Path) -> Dict[str, str]:
+    """Loads the page digests saved by the previous build, if any, then deletes the manifest.
+
+    Pages are overwritten in place, so an interrupted build leaves no manifest behind
+    and the next one rewrites every page instead of trusting stale digests. An unreadable
+    manifest is treated the same way."""
     try:
-        rel_path = output_path.relative_to(CONFIG["OUTPUT_DIR"])
-        depth = len(rel_path.parents) - 1
-        return "../" * depth if depth > 0 else ""
-    except ValueError:
-        return ""
+        manifest: Dict[str, str] = orjson.loads(manifest_path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError:
+        logger.warning(f"Ignoring unreadable build manifest: {manifest_path}")
+        manifest = {}
+    manifest_path.unlink()
+    if not isinstance(manifest, dict):
+        return {}
+    return manifest
 
-def render_template(
-    env: Environment, 
-    pages_data: List[Dict],
-    template_name: str, 
-    output_rel_path: str, 
-    **context
-):
-    """Renders a Jinja template to a file with robust error handling (Suggestion 3)."""
-    output_path = CONFIG["OUTPUT_DIR"] / output_rel_path
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    base_url = compute_base_url(output_path)
-    
-    # Global context available to all pages
-    full_context = {
+def save_manifest(manifest_path: Path, manifest: Dict[str, str]) -> None:
+    """Saves the page digests of this build for the next one."""
+    data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    # Written aside then swapped in, so a manifest on disk is always complete
+    write_bytes(f"{manifest_path}.tmp", data)
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+
+def remove_stale_files(output_path: Path, keep: Set[str]) -> int:
+    """Deletes output files not produced by this build, then any emptied directories.
+
+    `keep` holds '/'-separated paths relative to `output_path`, like the manifest keys.
+    Returns the number of files removed."""
+    removed = 0
+    for root, _, files in os.walk(output_path, topdown=False):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if os.path.relpath(file_path, output_path).replace(os.sep, "/") not in keep:
+                os.remove(file_path)
+                removed += 1
+        if root != str(output_path) and not os.listdir(root):
+            os.rmdir(root)
+    return removed
+
+def build_base_context(pages_data: List[Dict[str, Any]], commit_sha: str) -> Dict[str, Any]:
+    """Builds the context shared by all pages, computed once per build.
+
+    It already includes the Jinja2 globals, so each page only adds its own fields. The footer
+    only depends on this context, so it is rendered here once instead of on every page."""
+    base_context = {
+        **get_env().globals,
         "date": datetime.datetime.now().strftime("%Y-%m-%d"),
-        "base_url": base_url,
-        "home_link": f"{base_url}index.html",
         "menu": pages_data, # Global menu context
-        **context
+        "commit_sha": commit_sha,
     }
+    base_context["footer_html"] = Markup(get_template("_footer.html").render(base_context))
+    return base_context
+
+@functools.lru_cache(maxsize=None)
+def render_nav(base_url: str) -> Markup:
+    """Renders the navigation bar once per page depth, as it only depends on the base URL."""
+    return Markup(get_template("_nav.html").render(base_url=base_url, home_link=f"{base_url}index.html"))
+
+def render_template(
+    template: Template, 
+    base_context: Dict[str, Any],
+    output_rel_path: str, 
+    previous_digest: Optional[str] = None,
+    **context: Any
+) -> Optional[str]:
+    """Renders a Jinja template to a file with robust error handling (Suggestion 3).
+
+    The output directory must already exist (see `create_output_dirs`). The file is only
+    written when its content differs from `previous_digest` or it is missing.
+    Returns the digest of the rendered page, or None if rendering failed."""
+    # Plain strings only: this runs once per page, pathlib objects would add up
+    output_path = os.path.join(CONFIG["OUTPUT_DIR"], output_rel_path)
+    
+    # Relative path (e.g., '../', '../../') back to the root index
+    base_url = "../" * output_rel_path.count("/")
     
     try:
-        template = env.get_template(template_name)
-        output_path.write_text(template.render(**full_context), encoding="utf-8")
+        # Hand a ready-made context straight to the compiled root render function,
+        # skipping the extra dict merges done by Template.render
+        variables = {
+            **base_context,
+            "base_url": base_url,
+            "home_link": f"{base_url}index.html",
+            "nav_html": render_nav(base_url),
+            **context
+        }
+        data = "".join(template.root_render_func(template.new_context(variables, shared=True))).encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest != previous_digest or not os.path.exists(output_path):
+            write_bytes(output_path, data)
+        return digest
     except Exception as e:
-        logger.error(f"Failed to render '{template_name}' to '{output_path}'. Error: {e}")
+        logger.error(f"Failed to render '{template.name}' to '{output_path}'. Error: {e}")
+        return None
+
+def write_bytes(output_path: str, data: bytes) -> None:
+    """Writes data to a file through a raw file descriptor, bypassing Python's buffered I/O."""
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
-def get_pagination_range(current: int, total: int, delta: int = 3) -> List[Union[int, str]]:
-    """Calculates the range of page numbers for navigation."""
-    if total <= 1: return [1]
+@functools.lru_cache(maxsize=4096)
+def get_pagination_range(current: int, total: int, delta: int = 3) -> Tuple[Union[int, str], ...]:
+    """Calculates the range of page numbers for navigation (cached, hence an immutable tuple)."""
+    if total <= 1:
+        return (1,)
     start, end = max(2, current - delta), min(total - 1, current + delta)
-    pages = [1, "..."] if start > 2 else [1]
-    pages.extend(range(start, end + 1))
-    pages.extend(["...", total]) if end < total - 1 else pages.append(total) if end < total else None
-    return pages
+    head: Tuple[Union[int, str], ...] = (1, "...") if start > 2 else (1,)
+    if end < total - 1:
+        tail: Tuple[Union[int, str], ...] = ("...", total)
+    elif end < total:
+        tail = (total,)
+    else:
+        tail = ()
+    return (*head, *range(start, end + 1), *tail)
+
+def batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yields successive lists of `size` items (itertools.batched on Python 3.12+)."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 # -----------------------------
 # Page Generators
 # -----------------------------
-def generate_index(env: Environment, pages_data: List[Dict], total_rockets: int, total_variants: int, commit_sha: str):
-    """Generates the main index.html file."""
-    render_template(
-        env, 
-        pages_data,
-        "index.html",
-        "index.html",
-        title=CONFIG["INDEX_TITLE"],
-        description="SpaceDB home page listing catalog entries.",
-        canonical="index.html",
-        pages=pages_data,
-        num_rockets=total_rockets,
-        num_variants=total_variants,
-        commit_sha=commit_sha
-    )
-    logger.info("Generated index.html")
-
-def generate_about_page(env: Environment, pages_data: List[Dict], commit_sha: str):
-    """Generates the about.html file."""
-    render_template(
-        env, 
-        pages_data,
-        "about.html", 
-        "about.html",
-        title=CONFIG["ABOUT_TITLE"],
-        description="Learn about SpaceDB.",
-        canonical="about.html",
-        commit_sha=commit_sha
+# Each generator returns the pages to render as (template name, output path, context) tasks
+RenderTask = Tuple[str, str, Dict[str, Any]]
+
+def create_output_dirs(tasks: List[RenderTask]) -> None:
+    """Creates every distinct output directory once, before the workers write into them.
+
+    Slugs may contain '/', so pages can land one or more directories deeper than expected."""
+    for directory in {os.path.dirname(output_rel_path) for _, output_rel_path, _ in tasks}:
+        os.makedirs(os.path.join(CONFIG["OUTPUT_DIR"], directory), exist_ok=True)
+
+def render_task(task: RenderTask) -> Tuple[str, Optional[str]]:
+    """Renders one page task inside a worker process; its directory already exists.
+
+    Returns the page path with its digest (None if rendering failed)."""
+    template_name, output_rel_path, context = task
+    digest = render_template(
+        get_template(template_name),
+        _worker_base_context,
+        output_rel_path,
+        previous_digest=_worker_manifest.get(output_rel_path),
+        **context
     )
-    logger.info("Generated about.html")
+    return output_rel_path, digest
+
+def generate_index(base_context: Dict[str, Any], total_rockets: int, total_variants: int) -> List[RenderTask]:
+    """Generates the main index.html task."""
+    return [("index.html", "index.html", {
+        "title": CONFIG["INDEX_TITLE"],
+        "description": "SpaceDB home page listing catalog entries.",
+        "canonical": "index.html",
+        "pages": base_context["menu"],
+        "num_rockets": total_rockets,
+        "num_variants": total_variants,
+    })]
+
+def generate_about_page() -> List[RenderTask]:
+    """Generates the about.html task."""
+    return [("about.html", "about.html", {
+        "title": CONFIG["ABOUT_TITLE"],
+        "description": "Learn about SpaceDB.",
+        "canonical": "about.html",
+    })]
 
-def generate_rockets_listing(env: Environment, pages_data: List[Dict], rockets: List[Dict], commit_sha: str):
-    """Generates paginated listing pages for Rockets and their Variants."""
-    valid_rockets = [r for r in rockets if r.get("slug")]
-    if len(valid_rockets) < len(rockets):
-         logger.warning(f"Skipped {len(rockets) - len(valid_rockets)} rockets lacking a mandatory 'slug'.")
+def flatten_rockets(rockets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flattens rockets and their variants into the rows shared by the listing and detail pages.
 
-    # Flatten rockets + variants into one list for pagination
+    Each rocket row is followed by its variant rows; entries without a slug get no page and are skipped."""
     rows = []
-    for rocket in valid_rockets:
+    for rocket in rockets:
+        if not rocket.get("slug"):
+            logger.warning(f"Skipping rocket '{rocket.get('name', 'Unnamed')}' due to missing slug.")
+            continue
         rows.append({"type": "rocket", "data": rocket})
         for variant in rocket.get("variants", []):
-            if variant.get("slug"):
-                rows.append({"type": "variant", "data": variant, "root": rocket})
+            if not variant.get("slug"):
+                logger.warning(f"Skipping variant '{variant.get('name', 'Unnamed Variant')}' due to missing slug.")
+                continue
+            rows.append({"type": "variant", "data": variant, "root": rocket})
+    return rows
 
+def generate_rockets_listing(rows: List[Dict[str, Any]]) -> List[RenderTask]:
+    """Generates the paginated listing page tasks for Rockets and their Variants."""
     total_pages = math.ceil(len(rows) / CONFIG["ITEMS_PER_PAGE"])
-    
-    for page_num in range(1, total_pages + 1):
-        start = (page_num - 1) * CONFIG["ITEMS_PER_PAGE"]
-        page_rows = rows[start : start + CONFIG["ITEMS_PER_PAGE"]]
-        pagination = get_pagination_range(page_num, total_pages)
 
+    paginations = [get_pagination_range(page_num, total_pages) for page_num in range(1, total_pages + 1)]
+
+    tasks: List[RenderTask] = []
+    page_batches = batched(rows, CONFIG["ITEMS_PER_PAGE"])
+    for page_num, (page_rows, pagination) in enumerate(zip(page_batches, paginations), start=1):
         filename = f"{CONFIG['ROCKET_LIST_TITLE'].lower()}.html" if page_num == 1 else f"{CONFIG['ROCKET_LIST_TITLE'].lower()}_page_{page_num}.html"
+        tasks.append(("rockets.html", filename, {
+            "title": f"{CONFIG['ROCKET_LIST_TITLE']} – Page {page_num}",
+            "description": f"SpaceDB listing rockets – page {page_num}",
+            "canonical": filename,
+            "rockets_page": page_rows,
+            "current_page": page_num,
+            "total_pages": total_pages,
+            "pagination": pagination,
+        }))
 
-        render_template(
-            env, 
-            pages_data,
-            "rockets.html", 
-            filename,
-            title=f"{CONFIG['ROCKET_LIST_TITLE']} – Page {page_num}",
-            description=f"SpaceDB listing rockets – page {page_num}",
-            canonical=filename,
-            rockets_page=page_rows,
-            current_page=page_num,
-            total_pages=total_pages,
-            pagination=pagination,
-            commit_sha=commit_sha
-        )
-    logger.info(f"Generated {total_pages} rocket and variant listing pages.")
+    logger.info(f"Queued {total_pages} rocket and variant listing pages.")
+    return tasks
 
 
-def generate_rocket_and_variant_details(env: Environment, pages_data: List[Dict], rockets: List[Dict], commit_sha: str):
-    """Generates individual detail pages for each Rocket and Variant, skipping entries without a slug."""
+def generate_rocket_and_variant_details(rows: List[Dict[str, Any]]) -> List[RenderTask]:
+    """Generates the detail page tasks for each Rocket and Variant row."""
+    tasks: List[RenderTask] = []
     rocket_pages_count = 0
     variant_pages_count = 0
     
-    for rocket in rockets:
-        if not (r_slug := rocket.get("slug")):
-            logger.warning(f"Skipping detail pages for rocket '{rocket.get('name', 'Unnamed')}' due to missing slug.")
-            continue
-        
-        # Rocket detail page
-        render_template(
-            env, 
-            pages_data,
-            "rocket.html", 
-            f"rocket/{r_slug}.html",
-            title=f"{rocket['name']} ({rocket.get('manufacturer', 'Unknown')})",
-            description=f"Details for the {rocket['name']} rocket.",
-            canonical=f"rocket/{r_slug}.html",
-            rocket=rocket,
-            commit_sha=commit_sha
-        )
-        rocket_pages_count += 1
-
-        # Variant detail pages
-        for variant in rocket.get("variants", []):
-            if not (v_slug := variant.get("slug")):
-                logger.warning(f"Skipping variant '{variant.get('name', 'Unnamed Variant')}' due to missing slug.")
-                continue
-            
-            render_template(
-                env, 
-                pages_data,
-                "variant.html", 
-                f"rocket/{r_slug}/{v_slug}.html",
-                title=f"{variant['name']} ({rocket.get('manufacturer', 'Unknown')})",
-                description=f"Details for the {variant['name']} variant.",
-                canonical=f"rocket/{r_slug}/{v_slug}.html",
-                variant=variant,
-                rocket=rocket,
-                commit_sha=commit_sha
-            )
+    for row in rows:
+        if row["type"] == "rocket":
+            # Rocket detail page
+            rocket = row["data"]
+            page_path = f"rocket/{rocket['slug']}.html" # Output path and canonical URL
+            tasks.append(("rocket.html", page_path, {
+                "title": f"{rocket['name']} ({rocket.get('manufacturer', 'Unknown')})",
+                "description": f"Details for the {rocket['name']} rocket.",
+                "canonical": page_path,
+                "rocket": rocket,
+            }))
+            rocket_pages_count += 1
+        else:
+            # Variant detail page
+            variant, rocket = row["data"], row["root"]
+            page_path = f"rocket/{rocket['slug']}/{variant['slug']}.html"
+            tasks.append(("variant.html", page_path, {
+                "title": f"{variant['name']} ({rocket.get('manufacturer', 'Unknown')})",
+                "description": f"Details for the {variant['name']} variant.",
+                "canonical": page_path,
+                "variant": variant,
+                "rocket": rocket,
+            }))
             variant_pages_count += 1
-            
+
     total_detail_pages = rocket_pages_count + variant_pages_count
-    logger.info(f"Generated {rocket_pages_count} rocket pages and {variant_pages_count} variant pages for a total of {total_detail_pages} detail pages.")
+    logger.info(f"Queued {rocket_pages_count} rocket pages and {variant_pages_count} variant pages for a total of {total_detail_pages} detail pages.")
+    return tasks
 
 # -----------------------------
 # Main
 # -----------------------------
-if __name__ == "__main__":
+def main() -> None:
+    """Builds the whole site into OUTPUT_DIR."""
     parser = argparse.ArgumentParser()
     parser.add_argument("--commit-sha", default="", help="Git commit SHA for footer display")
+    parser.add_argument("--clean", action="store_true", help="Remove the output directory instead of updating it incrementally")
     args = parser.parse_args()
     commit_sha = args.commit_sha
 
     start_time = time.time()
 
     # 1. Setup Environment
-    cleanup_and_setup(CONFIG["OUTPUT_DIR"], CONFIG["ASSETS_DIR"])
+    asset_paths = cleanup_and_setup(CONFIG["OUTPUT_DIR"], CONFIG["ASSETS_DIR"], args.clean)
+    # Always consumed, even by a clean build, so an interrupted build leaves no manifest behind
+    previous_manifest = load_manifest(CONFIG["MANIFEST_FILE"])
+    if args.clean:
+        previous_manifest.clear()
     
     # Secure Jinja2 Setup
-    jinja_env = Environment(
-        loader=FileSystemLoader(str(CONFIG["TEMPLATE_DIR"])),
-        autoescape=select_autoescape(['html', 'xml']),
-        trim_blocks=True, 
-        lstrip_blocks=True
-    )
+    preload_templates()
 
     # 2. Load and Validate Data
-    pages_data = load_json(CONFIG["PAGES_FILE"])
-    rockets_data = load_json(CONFIG["ROCKETS_FILE"])
+    # The three files are independent, so read and parse them concurrently
+    with ThreadPoolExecutor(max_workers=3) as loader:
+        pages_data, rockets_data, rockets_schema = loader.map(
+            load_json, [CONFIG["PAGES_FILE"], CONFIG["ROCKETS_FILE"], CONFIG["ROCKETS_SCHEMA_FILE"]]
+        )
     
     try:
-        validate(instance=rockets_data, schema=load_json(CONFIG["ROCKETS_SCHEMA_FILE"]))
+        validate_rockets = create_validator(rockets_schema)
+        validate_rockets(rockets_data)
         logger.info("Rocket data validation successful.")
-    except (ValidationError, FileNotFoundError) as e:
+    except (JsonSchemaException, FileNotFoundError) as e:
         logger.error(f"FATAL: Rocket data validation failed. Aborting. Error: {e}")
         exit(1)
 
@@ -257,19 +449,45 @@ if __name__ == "__main__":
     
     total_rockets = len(rockets_data)
     total_variants = sum(len(r.get("variants", [])) for r in rockets_data)
-    
-    # 3. Generate All Pages Sequentially
 
-    # Static Pages
-    generate_index(jinja_env, pages_data, total_rockets, total_variants, commit_sha)
-    generate_about_page(jinja_env, pages_data, commit_sha)
-    
-    # Catalog Listing Pages (Rockets)
-    generate_rockets_listing(jinja_env, pages_data, rockets_data, commit_sha)
+    # One normalization pass shared by the listing and detail pages
+    rows = flatten_rockets(rockets_data)
     
-    # Detail Pages (Rockets and Variants)
-    generate_rocket_and_variant_details(jinja_env, pages_data, rockets_data, commit_sha)
+    # 3. Generate All Pages
+    base_context = build_base_context(pages_data, commit_sha)
+
+    tasks = [
+        # Detail Pages (Rockets and Variants)
+        *generate_rocket_and_variant_details(rows),
+        # Static Pages
+        *generate_index(base_context, total_rockets, total_variants),
+        *generate_about_page(),
+        # Catalog Listing Pages (Rockets)
+        *generate_rockets_listing(rows),
+    ]
+
+    create_output_dirs(tasks)
+
+    # Every page is independent: fan them all out over the worker processes in batches,
+    # at least four per worker so the load stays balanced, at most 64 pages each
+    manifest = {}
+    chunksize = max(1, min(64, len(tasks) // ((os.cpu_count() or 1) * 4)))
+    with get_executor(base_context, previous_manifest) as executor:
+        for output_rel_path, digest in executor.map(render_task, tasks, chunksize=chunksize):
+            if digest is not None:
+                manifest[output_rel_path] = digest
+    changed = sum(1 for path, digest in manifest.items() if previous_manifest.get(path) != digest)
+    logger.info(f"Generated {len(manifest)} pages, {changed} of them new or changed.")
+
+    # 4. Drop pages from older builds and remember this one
+    save_manifest(CONFIG["MANIFEST_FILE"], manifest)
+    removed = remove_stale_files(CONFIG["OUTPUT_DIR"], {*manifest, *asset_paths})
+    logger.info(f"Removed {removed} stale files.")
 
     # Final Output
     elapsed_time = time.time() - start_time
-    logger.info(f"Site generation finished in {elapsed_time:.2f} seconds.")
\ No newline at end of file
+    logger.info(f"Site generation finished in {elapsed_time:.2f} seconds.")
+
+
+if __name__ == "__main__":
+    main()